@@ -23,7 +23,10 @@ import os
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional
+import atexit
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Default settings for MITRE enrichment (used when no settings provided)
 DEFAULT_MITRE_SETTINGS = {
@@ -59,6 +62,16 @@ RESOURCE_FILES = [
 # Database files (by year) - we'll download only needed years
 DATABASE_YEARS = list(range(1999, datetime.now().year + 1))
 
+# Pooled session for MITRE/CVE2CAPEC downloads (per-year files share one host).
+# Read timeouts are not retried: a stalled download already waits the full timeout
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=5, read=0, backoff_factor=0.5, status_forcelist=(429, 502, 503, 504)),
+))
+atexit.register(HTTP_SESSION.close)
+
 
 # =============================================================================
 # Database Management
@@ -104,7 +117,7 @@ def download_file(url: str, dest_path: Path) -> bool:
     """Download a file from URL to destination path."""
     try:
         print(f"    Downloading: {dest_path.name}...", end=" ", flush=True)
-        response = requests.get(url, timeout=60)
+        response = HTTP_SESSION.get(url, timeout=60)
         response.raise_for_status()
         dest_path.write_bytes(response.content)
         print("OK")
@@ -158,7 +171,7 @@ def download_cwe_metadata(db_path: Path, settings: Optional[Dict] = None) -> boo
 
     try:
         # Download the ZIP file
-        response = requests.get(CWE_XML_URL, timeout=180)
+        response = HTTP_SESSION.get(CWE_XML_URL, timeout=180)
         response.raise_for_status()
 
         # Extract XML from ZIP
@@ -345,7 +358,7 @@ def download_capec_metadata(db_path: Path, settings: Optional[Dict] = None) -> b
 
     try:
         # Download the XML file
-        response = requests.get(CAPEC_XML_URL, timeout=180)
+        response = HTTP_SESSION.get(CAPEC_XML_URL, timeout=180)
         response.raise_for_status()
 
         # Parse XML
@@ -11,7 +11,9 @@ import re
 import glob
 import json
 import time
+import asyncio
 import dns.resolver
+import dns.asyncresolver
 from pathlib import Path
 from datetime import datetime
 import sys
@@ -25,6 +27,10 @@ sys.path.insert(0, str(PROJECT_ROOT))
 OUTPUT_DIR = Path(__file__).parent / "output"
 DNS_RECORD_TYPES = ['A', 'AAAA', 'MX', 'NS', 'TXT', 'SOA', 'CNAME']
 
+# Maximum hosts resolved at the same time by dns_lookup_many()
+# (each host queries all DNS_RECORD_TYPES concurrently)
+DNS_CONCURRENCY = 50
+
 
 def get_tor_session(anonymous: bool):
     """Get requests session, optionally through Tor."""
@@ -194,6 +200,11 @@ def dns_lookup(hostname: str, max_retries: int = 3) -> dict:
     for rtype in DNS_RECORD_TYPES:
         dns_data[rtype] = dns_lookup_single(hostname, rtype, max_retries)
     
+    return build_dns_result(dns_data)
+
+
+def build_dns_result(dns_data: dict) -> dict:
+    """Build the DNS result structure (records + extracted IPs) for one host."""
     # Extract IPs for convenience
     ips = {
         "ipv4": dns_data.get("A") or [],
@@ -207,6 +218,77 @@ def dns_lookup(hostname: str, max_retries: int = 3) -> dict:
     }
 
 
+async def dns_lookup_single_async(resolver, hostname: str, rtype: str, max_retries: int = 3) -> list:
+    """
+    Async variant of dns_lookup_single() using dnspython's async resolver.
+
+    Args:
+        resolver: dns.asyncresolver.Resolver instance
+        hostname: Domain or subdomain to resolve
+        rtype: DNS record type (A, AAAA, MX, etc.)
+        max_retries: Maximum retry attempts
+
+    Returns:
+        List of DNS records or None if not found/failed
+    """
+    for attempt in range(max_retries):
+        try:
+            answers = await resolver.resolve(hostname, rtype)
+            return [rr.to_text() for rr in answers]
+        except (dns.resolver.NoAnswer, dns.resolver.NXDOMAIN):
+            # These are expected "not found" responses - no retry needed
+            return None
+        except Exception:
+            # Temporary or unexpected failures - retry with exponential backoff
+            if attempt < max_retries - 1:
+                await asyncio.sleep(2 ** attempt)
+                continue
+            return None
+
+    return None
+
+
+async def dns_lookup_async(resolver, semaphore, hostname: str, max_retries: int = 3) -> dict:
+    """Resolve all DNS_RECORD_TYPES for a host concurrently (bounded by semaphore)."""
+    async with semaphore:
+        records = await asyncio.gather(*(
+            dns_lookup_single_async(resolver, hostname, rtype, max_retries)
+            for rtype in DNS_RECORD_TYPES
+        ))
+    return build_dns_result(dict(zip(DNS_RECORD_TYPES, records)))
+
+
+def dns_lookup_many(hostnames: list, max_retries: int = 3, concurrency: int = DNS_CONCURRENCY) -> dict:
+    """
+    Perform full DNS lookups for many hosts concurrently.
+
+    Sync wrapper around dns_lookup_async(): all hosts are resolved in a
+    single event loop instead of one blocking dns_lookup() per host.
+
+    Args:
+        hostnames: Domains or subdomains to resolve
+        max_retries: Maximum retry attempts per record type
+        concurrency: Maximum hosts resolved at the same time
+
+    Returns:
+        Dictionary mapping each hostname to its dns_lookup() style result
+    """
+    hostnames = list(dict.fromkeys(hostnames))
+    if not hostnames:
+        return {}
+
+    async def _resolve_all():
+        resolver = dns.asyncresolver.Resolver()
+        semaphore = asyncio.Semaphore(concurrency)
+        results = await asyncio.gather(*(
+            dns_lookup_async(resolver, semaphore, hostname, max_retries)
+            for hostname in hostnames
+        ))
+        return dict(zip(hostnames, results))
+
+    return asyncio.run(_resolve_all())
+
+
 def verify_domain_ownership(domain: str, token: str, txt_prefix: str = "_redamon-verify") -> dict:
     """
     Verify domain ownership via DNS TXT record.
@@ -286,18 +368,17 @@ def resolve_all_dns(domain: str, subdomains: list) -> dict:
         "subdomains": {}
     }
     
-    # Resolve root domain
+    # Resolve root domain and all subdomains concurrently
+    hosts = [domain] + [subdomain for subdomain in subdomains if subdomain != domain]
+    dns_results = dns_lookup_many(hosts)
+
     print(f"  [*] {domain} (root)")
-    result["domain"] = dns_lookup(domain)
+    result["domain"] = dns_results[domain]
     if result["domain"]["ips"]["ipv4"]:
         print(f"      → {', '.join(result['domain']['ips']['ipv4'])}")
     
-    # Resolve each subdomain
-    for subdomain in subdomains:
-        if subdomain == domain:
-            continue
-        
-        dns_result = dns_lookup(subdomain)
+    for subdomain in hosts[1:]:
+        dns_result = dns_results[subdomain]
         result["subdomains"][subdomain] = dns_result
         
         if dns_result["ips"]["ipv4"] or dns_result["ips"]["ipv6"]:
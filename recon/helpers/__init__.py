@@ -52,11 +52,13 @@ from .cve_helpers import (
     normalize_product_name,
     classify_cvss_score,
     lookup_cves_nvd,
+    lookup_cves_nvd_batch,
     lookup_cves_vulners,
     run_cve_lookup,
     CPE_MAPPINGS,
     NVD_API_URL,
     VULNERS_API_URL,
+    HTTP_SESSION,
 )
 
 # Security checks
@@ -108,11 +110,13 @@ __all__ = [
     "normalize_product_name",
     "classify_cvss_score",
     "lookup_cves_nvd",
+    "lookup_cves_nvd_batch",
     "lookup_cves_vulners",
     "run_cve_lookup",
     "CPE_MAPPINGS",
     "NVD_API_URL",
     "VULNERS_API_URL",
+    "HTTP_SESSION",
     # Security checks
     "run_security_checks",
     # Anonymity/Tor
@@ -4,10 +4,17 @@ RedAmon - CVE Lookup Helpers
 Functions for looking up CVEs from NVD and Vulners APIs based on detected technologies.
 """
 
+import os
 import re
+import json
 import time
+import atexit
+import hashlib
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 
@@ -18,6 +25,37 @@ from typing import Dict, List, Optional, Tuple
 NVD_API_URL = "https://services.nvd.nist.gov/rest/json/cves/2.0"
 VULNERS_API_URL = "https://vulners.com/api/v3/burp/software/"
 
+# NVD rate limits: 5 requests / 30s without API key, 50 requests / 30s with one
+NVD_REQUEST_DELAY = 6.0
+NVD_REQUEST_DELAY_WITH_KEY = 0.6
+
+# Disk cache for NVD responses (one file per unique query)
+NVD_CACHE_DIR = Path(__file__).parent.parent / "data" / "nvd_cache"
+NVD_CACHE_TTL_HOURS = 24
+
+
+# =============================================================================
+# Shared HTTP Session
+# =============================================================================
+
+# Pooled session for NVD/Vulners lookups: keeps TLS connections alive across
+# queries and retries transient gateway errors. 429 is not retried here so the
+# key-aware rate-limit handling in _query_nvd() owns it, and read timeouts are
+# not retried so one slow query cannot block for several timeout periods.
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=5,
+        read=0,
+        backoff_factor=0.5,
+        status_forcelist=(502, 503, 504),
+        raise_on_status=False,
+    ),
+))
+atexit.register(HTTP_SESSION.close)
+
 
 # =============================================================================
 # CPE Mappings for Common Technologies
@@ -346,34 +384,24 @@ def classify_cvss_score(score: float) -> str:
 # NVD API Lookup
 # =============================================================================
 
-def lookup_cves_nvd(
-    product: str, 
-    version: str = None, 
-    max_results: int = 20,
-    api_key: str = None
-) -> List[Dict]:
+def _build_nvd_params(product: str, version: str = None, max_results: int = 20) -> Dict:
     """
-    Query NVD API for CVEs affecting a product/version.
-    
+    Build NVD API query parameters for a product/version.
+
+    Known products are queried by CPE name, unknown ones by keyword.
+
     Args:
         product: Product name (e.g., 'nginx')
         version: Version string (e.g., '1.19.0')
         max_results: Maximum results to return
-        api_key: Optional NVD API key for higher rate limits
-        
+
     Returns:
-        List of CVE dictionaries
+        Query parameters for the NVD CVE API
     """
-    cves = []
     product_normalized = normalize_product_name(product)
     cpe_info = CPE_MAPPINGS.get(product_normalized)
 
     params = {"resultsPerPage": max_results}
-    headers = {}
-
-    # Add API key if available
-    if api_key:
-        headers["apiKey"] = api_key
 
     if cpe_info and version:
         vendor, prod = cpe_info
@@ -388,64 +416,209 @@ def lookup_cves_nvd(
             keyword += f" {version}"
         params["keywordSearch"] = keyword
 
+    return params
+
+
+def _parse_nvd_response(data: Dict) -> List[Dict]:
+    """Convert an NVD API response into the CVE dictionaries used in recon data."""
+    cves = []
+
+    for vuln in data.get("vulnerabilities", []):
+        cve_data = vuln.get("cve", {})
+        cve_id = cve_data.get("id", "")
+        
+        metrics = cve_data.get("metrics", {})
+        cvss_v3 = metrics.get("cvssMetricV31", [{}])[0] if metrics.get("cvssMetricV31") else None
+        cvss_v2 = metrics.get("cvssMetricV2", [{}])[0] if metrics.get("cvssMetricV2") else None
+        
+        cvss_score = None
+        severity = None
+        
+        if cvss_v3:
+            cvss_score = cvss_v3.get("cvssData", {}).get("baseScore")
+            severity = cvss_v3.get("cvssData", {}).get("baseSeverity")
+        elif cvss_v2:
+            cvss_score = cvss_v2.get("cvssData", {}).get("baseScore")
+            severity = cvss_v2.get("baseSeverity")
+        
+        descriptions = cve_data.get("descriptions", [])
+        description = next((d["value"] for d in descriptions if d.get("lang") == "en"), "")
+        
+        refs = cve_data.get("references", [])
+        reference_urls = [ref.get("url") for ref in refs[:3] if ref.get("url")]
+        
+        cves.append({
+            "id": cve_id,
+            "cvss": cvss_score,
+            "severity": severity,
+            "description": description[:300] if description else "",
+            "published": cve_data.get("published"),
+            "references": reference_urls,
+            "source": "nvd",
+            "url": f"https://nvd.nist.gov/vuln/detail/{cve_id}",
+        })
+
+    return cves
+
+
+def _query_nvd(params: Dict, product: str, api_key: str = None, retry: bool = False) -> Optional[List[Dict]]:
+    """
+    Run a single NVD API query.
+
+    Returns:
+        List of CVE dictionaries, or None if the query failed (not cacheable)
+    """
+    headers = {}
+
+    # Add API key if available
+    if api_key:
+        headers["apiKey"] = api_key
+
     try:
-        response = requests.get(NVD_API_URL, params=params, headers=headers, timeout=30)
+        response = HTTP_SESSION.get(NVD_API_URL, params=params, headers=headers, timeout=30)
 
         # Handle rate limiting (NVD returns 403 or 429 when rate limited)
         if response.status_code == 403:
             print(f"        [!] NVD API rate limited. Add NVD_API_KEY env var for higher limits.")
-            return cves
+            return None
         if response.status_code == 404:
             # 404 can occur with invalid CPE format or when service is unavailable
             print(f"        [!] NVD API returned 404 for {product}. Skipping CVE lookup.")
-            return cves
+            return None
         if response.status_code == 429:
-            print(f"        [!] NVD API rate limited (429). Waiting...")
-            time.sleep(6)  # Wait 6 seconds and continue
-            return cves
+            retry_after = response.headers.get("Retry-After", "")
+            wait = int(retry_after) if retry_after.isdigit() else NVD_REQUEST_DELAY
+            print(f"        [!] NVD API rate limited (429). Waiting {wait}s...")
+            time.sleep(wait)
+            if retry:
+                return _query_nvd(params, product, api_key)
+            return None
 
         response.raise_for_status()
-        data = response.json()
+        return _parse_nvd_response(response.json())
 
-        for vuln in data.get("vulnerabilities", []):
-            cve_data = vuln.get("cve", {})
-            cve_id = cve_data.get("id", "")
-            
-            metrics = cve_data.get("metrics", {})
-            cvss_v3 = metrics.get("cvssMetricV31", [{}])[0] if metrics.get("cvssMetricV31") else None
-            cvss_v2 = metrics.get("cvssMetricV2", [{}])[0] if metrics.get("cvssMetricV2") else None
-            
-            cvss_score = None
-            severity = None
-            
-            if cvss_v3:
-                cvss_score = cvss_v3.get("cvssData", {}).get("baseScore")
-                severity = cvss_v3.get("cvssData", {}).get("baseSeverity")
-            elif cvss_v2:
-                cvss_score = cvss_v2.get("cvssData", {}).get("baseScore")
-                severity = cvss_v2.get("baseSeverity")
-            
-            descriptions = cve_data.get("descriptions", [])
-            description = next((d["value"] for d in descriptions if d.get("lang") == "en"), "")
-            
-            refs = cve_data.get("references", [])
-            reference_urls = [ref.get("url") for ref in refs[:3] if ref.get("url")]
-            
-            cves.append({
-                "id": cve_id,
-                "cvss": cvss_score,
-                "severity": severity,
-                "description": description[:300] if description else "",
-                "published": cve_data.get("published"),
-                "references": reference_urls,
-                "source": "nvd",
-                "url": f"https://nvd.nist.gov/vuln/detail/{cve_id}",
-            })
-            
     except Exception as e:
         print(f"        [!] NVD API error: {str(e)[:80]}")
+        return None
+
+
+def lookup_cves_nvd(
+    product: str, 
+    version: str = None, 
+    max_results: int = 20,
+    api_key: str = None
+) -> List[Dict]:
+    """
+    Query NVD API for CVEs affecting a product/version.
     
-    return cves
+    Args:
+        product: Product name (e.g., 'nginx')
+        version: Version string (e.g., '1.19.0')
+        max_results: Maximum results to return
+        api_key: Optional NVD API key for higher rate limits
+        
+    Returns:
+        List of CVE dictionaries
+    """
+    params = _build_nvd_params(product, version, max_results)
+    return _query_nvd(params, product, api_key) or []
+
+
+def _nvd_cache_file(params: Dict) -> Path:
+    """Return the cache file for an NVD query (keyed by SHA1 of its parameters)."""
+    key = hashlib.sha1(json.dumps(params, sort_keys=True).encode()).hexdigest()
+    return NVD_CACHE_DIR / f"{key}.json"
+
+
+def _read_nvd_cache(params: Dict, ttl_hours: float) -> Optional[List[Dict]]:
+    """Return cached CVEs for an NVD query, or None if missing or expired."""
+    cache_file = _nvd_cache_file(params)
+    if ttl_hours <= 0 or not cache_file.exists():
+        return None
+    if (time.time() - cache_file.stat().st_mtime) / 3600 >= ttl_hours:
+        return None
+    try:
+        with open(cache_file, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_nvd_cache(params: Dict, cves: List[Dict]) -> None:
+    """Store CVEs for an NVD query in the disk cache."""
+    try:
+        NVD_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(_nvd_cache_file(params), 'w') as f:
+            json.dump(cves, f)
+    except OSError as e:
+        print(f"        [!] Could not write NVD cache: {e}")
+
+
+def lookup_cves_nvd_batch(
+    products: List[Tuple[str, Optional[str]]],
+    max_results: int = 20,
+    api_key: str = None,
+    cache_ttl_hours: float = NVD_CACHE_TTL_HOURS
+) -> Dict[Tuple[str, Optional[str]], List[Dict]]:
+    """
+    Query NVD for many product/version pairs at once.
+
+    Pairs that map to the same NVD query are deduplicated, responses are
+    cached on disk for cache_ttl_hours, and live requests are paced to the
+    NVD rate limit (faster when an API key is available). The NVD 2.0 API
+    accepts a single cpeName per request, so each unique query still costs
+    one request on a cache miss.
+
+    Args:
+        products: List of (product, version) tuples
+        max_results: Maximum results per query
+        api_key: Optional NVD API key (defaults to NVD_API_KEY env var)
+        cache_ttl_hours: Cache lifetime in hours (0 disables the cache)
+
+    Returns:
+        Dictionary mapping each (product, version) tuple to its CVE list
+    """
+    api_key = api_key or os.getenv("NVD_API_KEY")
+    delay = NVD_REQUEST_DELAY_WITH_KEY if api_key else NVD_REQUEST_DELAY
+
+    # Group pairs by their NVD query
+    queries = {}
+    for product, version in products:
+        params = _build_nvd_params(product, version, max_results)
+        query_key = json.dumps(params, sort_keys=True)
+        queries.setdefault(query_key, (params, []))[1].append((product, version))
+
+    # Serve what we can from the cache first so the live count is known upfront
+    results = {}
+    pending = []
+    for params, pairs in queries.values():
+        cves = _read_nvd_cache(params, cache_ttl_hours)
+        if cves is None:
+            pending.append((params, pairs))
+            continue
+        for pair in pairs:
+            results[pair] = cves
+
+    print(f"    [*] NVD queries: {len(queries)} unique "
+          f"({len(queries) - len(pending)} from cache, {len(pending)} live)", flush=True)
+
+    last_request = None
+    for i, (params, pairs) in enumerate(pending, 1):
+        product, version = pairs[0]
+        print(f"        [{i}/{len(pending)}] NVD: {product} {version or ''}".rstrip(), flush=True)
+        if last_request is not None:
+            wait = delay - (time.monotonic() - last_request)
+            if wait > 0:
+                time.sleep(wait)
+        cves = _query_nvd(params, product, api_key, retry=True)
+        last_request = time.monotonic()
+        if cves is not None:
+            _write_nvd_cache(params, cves)
+
+        for pair in pairs:
+            results[pair] = cves or []
+
+    return results
 
 
 # =============================================================================
@@ -473,7 +646,7 @@ def lookup_cves_vulners(product: str, version: str, api_key: str = None) -> List
         params["apiKey"] = api_key
     
     try:
-        response = requests.get(VULNERS_API_URL, params=params, timeout=30)
+        response = HTTP_SESSION.get(VULNERS_API_URL, params=params, timeout=30)
         response.raise_for_status()
         data = response.json()
         
@@ -571,6 +744,16 @@ def run_cve_lookup(
     # Lookup CVEs
     cve_results = {}
     all_cves = []
+    use_vulners = source == "vulners" and vulners_api_key
+
+    # NVD: resolve all technologies in one batch (deduplicated, cached, rate limited)
+    nvd_results = {}
+    if not use_vulners:
+        products = []
+        for tech in tech_to_lookup:
+            name, version = parse_technology_string(tech)
+            products.append((normalize_product_name(name), version))
+        nvd_results = lookup_cves_nvd_batch(products, max_cves, nvd_api_key)
     
     for i, tech in enumerate(tech_to_lookup, 1):
         name, version = parse_technology_string(tech)
@@ -578,10 +761,10 @@ def run_cve_lookup(
         
         print(f"    [{i}/{len(tech_to_lookup)}] {tech}...", end=" ", flush=True)
         
-        if source == "vulners" and vulners_api_key:
+        if use_vulners:
             cves = lookup_cves_vulners(name, version, vulners_api_key)
         else:
-            cves = lookup_cves_nvd(name, version, max_cves, nvd_api_key)
+            cves = list(nvd_results.get((name, version), []))
         
         # Filter by min CVSS
         if min_cvss > 0:
@@ -604,10 +787,6 @@ def run_cve_lookup(
             print(f"✓ {len(cves)} CVEs found")
         else:
             print("no CVEs")
-        
-        # Rate limiting for NVD API
-        if source == "nvd" and i < len(tech_to_lookup):
-            time.sleep(6)
     
     # Count unique CVEs
     unique_cve_ids = set()
@@ -18,12 +18,29 @@ Run this file to execute the full recon pipeline.
 """
 
 import sys
-import json
+import time
+import logging
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
+from typing import NamedTuple, Optional
+from datetime import datetime, timezone
+
+# Console logger for pipeline progress (plain messages, same output as print)
+logger = logging.getLogger("redamon")
+if not logger.handlers:
+    _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+# Directory of this module, resolved once and reused for all derived paths
+_HERE = Path(__file__).parent
 
 # Add project root to path for imports (needed for graph_db, utils modules)
-PROJECT_ROOT = Path(__file__).parent.parent
+PROJECT_ROOT = _HERE.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 # Import settings from project_settings (fetches from API or falls back to params.py)
@@ -44,18 +61,31 @@ PROJECT_ID = _settings['PROJECT_ID']
 VERIFY_DOMAIN_OWNERSHIP = _settings['VERIFY_DOMAIN_OWNERSHIP']
 OWNERSHIP_TOKEN = _settings['OWNERSHIP_TOKEN']
 OWNERSHIP_TXT_PREFIX = _settings['OWNERSHIP_TXT_PREFIX']
+SKIP_COMPLETED_PHASES = _settings.get('SKIP_COMPLETED_PHASES', False)
+
+# Pipeline modules in execution order (used to build scan_type)
+ORDERED_MODULES = ("domain_discovery", "port_scan", "http_probe", "resource_enum", "vuln_scan")
+
+# Enabled modules as a frozenset, computed once for O(1) membership checks
+ENABLED_MODULES = frozenset(
+    m.strip() for m in (SCAN_MODULES.split(",") if isinstance(SCAN_MODULES, str) else SCAN_MODULES)
+)
 
-# Import recon modules
-from recon.whois_recon import whois_lookup
-from recon.domain_recon import discover_subdomains, verify_domain_ownership
-from recon.port_scan import run_port_scan
-from recon.http_probe import run_http_probe
-from recon.resource_enum import run_resource_enum
-from recon.vuln_scan import run_vuln_scan
-from recon.add_mitre import run_mitre_enrichment
+# Recon modules are imported lazily where they are used, so modules excluded
+# from SCAN_MODULES never pay their import cost
 
 # Output directory
-OUTPUT_DIR = Path(__file__).parent / "output"
+OUTPUT_DIR = _HERE / "output"
+
+# Console banner and separator lines (built once at import)
+BANNER_TOP = "╔" + "═" * 68 + "╗"
+BANNER_TITLE = f"║{'':20}{'RedAmon OSINT Framework':<48}║"
+BANNER_SUBTITLE = f"║{'':15}{'Automated Reconnaissance Pipeline':<53}║"
+BANNER_BOT = "╚" + "═" * 68 + "╝"
+SECTION_RULE = "=" * 70
+PHASE_RULE = "-" * 40
+CONFIG_RULE = "═" * 63
+SUMMARY_RULE = "─" * 50
 
 
 def should_skip_active_scans(recon_data: dict) -> tuple:
@@ -88,7 +118,15 @@ def should_skip_active_scans(recon_data: dict) -> tuple:
     return False, ""
 
 
-def parse_target(target: str, subdomain_list: list = None) -> dict:
+class TargetInfo(NamedTuple):
+    """Parsed scan target and scope (see parse_target())."""
+    root_domain: str
+    filtered_mode: bool
+    full_subdomains: tuple
+    include_root_domain: bool
+
+
+def parse_target(target: str, subdomain_list: list = None) -> TargetInfo:
     """
     Parse target domain and determine scan mode based on SUBDOMAIN_LIST.
 
@@ -100,76 +138,185 @@ def parse_target(target: str, subdomain_list: list = None) -> dict:
                        Special prefix "." = include root domain directly (no subdomain)
 
     Returns:
-        Dictionary with:
-        - target: original target (root domain)
+        TargetInfo with:
         - root_domain: the root domain (same as target)
         - filtered_mode: True if SUBDOMAIN_LIST has entries (filtered scan)
-        - subdomain_list: list of subdomain prefixes to scan
-        - full_subdomains: list of full subdomain names (prefix + root domain)
+        - full_subdomains: tuple of full subdomain names (prefix + root domain)
         - include_root_domain: True if "." is in subdomain_list (scan root domain directly)
     """
+    return _parse_target(target, tuple(subdomain_list or ()))
+
+
+@lru_cache(maxsize=4096)
+def _parse_target(target: str, subdomain_list: tuple) -> TargetInfo:
+    """Memoized body of parse_target(); the returned TargetInfo is immutable."""
     # TARGET_DOMAIN is always the root domain (e.g., "vulnweb.com")
     root_domain = target
 
     # Determine if we're in filtered mode (SUBDOMAIN_LIST has entries)
-    subdomain_list = subdomain_list or []
     filtered_mode = len(subdomain_list) > 0
 
     # Check if root domain should be included (prefix "." means root domain)
     include_root_domain = False
-    
+
     # Build full subdomain names from prefixes
     full_subdomains = []
-    if filtered_mode:
-        for prefix in subdomain_list:
-            # Handle "." as special case meaning root domain itself
-            clean_prefix = prefix.rstrip('.')
-            if clean_prefix == "" or prefix == ".":
-                # "." means include root domain directly (e.g., vulnweb.com)
-                include_root_domain = True
-                # Add root domain to the list
-                if root_domain not in full_subdomains:
-                    full_subdomains.append(root_domain)
-            else:
-                # Normal subdomain prefix (e.g., "testphp." -> testphp.vulnweb.com)
-                full_subdomain = f"{clean_prefix}.{root_domain}"
-                if full_subdomain not in full_subdomains:
-                    full_subdomains.append(full_subdomain)
-
-    return {
-        "target": target,
-        "root_domain": root_domain,
-        "filtered_mode": filtered_mode,
-        "subdomain_list": subdomain_list,
-        "full_subdomains": full_subdomains,
-        "include_root_domain": include_root_domain
-    }
+    for prefix in subdomain_list:
+        # Handle "." as special case meaning root domain itself
+        clean_prefix = prefix.rstrip('.')
+        if clean_prefix == "" or prefix == ".":
+            # "." means include root domain directly (e.g., vulnweb.com)
+            include_root_domain = True
+            # Add root domain to the list
+            if root_domain not in full_subdomains:
+                full_subdomains.append(root_domain)
+        else:
+            # Normal subdomain prefix (e.g., "testphp." -> testphp.vulnweb.com)
+            full_subdomain = f"{clean_prefix}.{root_domain}"
+            if full_subdomain not in full_subdomains:
+                full_subdomains.append(full_subdomain)
+
+    return TargetInfo(
+        root_domain=root_domain,
+        filtered_mode=filtered_mode,
+        full_subdomains=tuple(full_subdomains),
+        include_root_domain=include_root_domain,
+    )
+
+
+def should_run_phase(recon_data: dict, phase: str) -> bool:
+    """
+    Check if a phase still has to run on previously saved recon data.
+
+    Every enabled phase runs again by default. With SKIP_COMPLETED_PHASES
+    enabled, phases already listed in metadata.modules_executed are skipped,
+    so iterating on downstream phases does not repeat expensive scans
+    (naabu, httpx, nuclei, NVD lookups).
+
+    Args:
+        recon_data: Current reconnaissance data
+        phase: Phase name as recorded in modules_executed
+
+    Returns:
+        True if the phase should run
+    """
+    executed = recon_data.get("metadata", {}).get("modules_executed", [])
+    if SKIP_COMPLETED_PHASES and phase in executed:
+        logger.info(f"[*] Skipping {phase}: already executed (SKIP_COMPLETED_PHASES is enabled)")
+        return False
+    return True
 
 
 def build_scan_type() -> str:
     """Build dynamic scan type based on enabled modules."""
-    modules = []
-    if "domain_discovery" in SCAN_MODULES:
-        modules.append("domain_discovery")
-    if "port_scan" in SCAN_MODULES:
-        modules.append("port_scan")
-    if "http_probe" in SCAN_MODULES:
-        modules.append("http_probe")
-    if "resource_enum" in SCAN_MODULES:
-        modules.append("resource_enum")
-    if "vuln_scan" in SCAN_MODULES:
-        modules.append("vuln_scan")
-    return "_".join(modules) if modules else "custom"
+    return "_".join(m for m in ORDERED_MODULES if m in ENABLED_MODULES) or "custom"
 
 
 def save_recon_file(data: dict, output_file: Path):
     """Save recon data to JSON file."""
-    with open(output_file, 'w') as f:
-        json.dump(data, f, indent=2)
+    output_file.write_bytes(orjson.dumps(
+        data,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        default=str
+    ))
+
+
+# Open NDJSON delta streams, keyed by recon output file (kept open for the run)
+_delta_streams = {}
+
+
+def get_delta_file(output_file: Path) -> Path:
+    """Return the NDJSON sidecar path used for phase deltas of a recon file."""
+    return output_file.with_suffix(".ndjson")
+
+
+def save_phase_delta(output_file: Path, phase: str, data: dict):
+    """
+    Append a phase delta record to the NDJSON sidecar of the recon file.
+
+    Only the top-level keys touched by the phase are written, instead of
+    re-serializing the whole recon dict after every phase. The merged JSON
+    is materialized once by finalize_recon_file().
+
+    Args:
+        output_file: Path to the recon JSON file
+        phase: Name of the phase that produced the delta
+        data: Top-level recon keys (and their values) changed by the phase
+    """
+    stream = _delta_streams.get(output_file)
+    if stream is None:
+        stream = open(get_delta_file(output_file), 'ab', buffering=1 << 16)
+        _delta_streams[output_file] = stream
+    stream.write(orjson.dumps(
+        {"phase": phase, "data": data},
+        option=orjson.OPT_NON_STR_KEYS,
+        default=str
+    ) + b"\n")
+    # One small record per phase: flush so it survives a SIGTERM'd container
+    stream.flush()
+
+
+def load_recon_file(output_file: Path) -> dict:
+    """Load recon data from JSON file (empty dict if it does not exist)."""
+    if not output_file.exists():
+        return {}
+    return orjson.loads(output_file.read_bytes())
+
+
+def finalize_recon_file(output_file: Path, data: dict = None) -> dict:
+    """
+    Merge the NDJSON phase deltas into the recon JSON file.
+
+    When the in-memory recon data is passed it already contains every delta,
+    so it is written directly without re-reading the recon file. Otherwise
+    the existing recon file is used as the base and every delta is replayed
+    on top of it in order - this recovers a sidecar left behind by an
+    interrupted run.
+
+    Args:
+        output_file: Path to the recon JSON file
+        data: Current in-memory recon data (optional)
+
+    Returns:
+        The merged recon data
+    """
+    stream = _delta_streams.pop(output_file, None)
+    if stream is not None:
+        stream.close()
+
+    delta_file = get_delta_file(output_file)
+    if data is not None:
+        save_recon_file(data, output_file)
+        delta_file.unlink(missing_ok=True)
+        return data
+
+    merged = load_recon_file(output_file)
+    if not delta_file.exists():
+        return merged
+
+    with open(delta_file, 'rb') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                record = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                # Truncated last line from an interrupted run
+                break
+            merged.update(record.get("data", {}))
+
+    save_recon_file(merged, output_file)
+    delta_file.unlink()
+    return merged
+
+
+def _delta(recon_data: dict, *keys: str) -> dict:
+    """Pick the given top-level keys (plus metadata) from recon data for a delta record."""
+    return {key: recon_data[key] for key in ("metadata",) + keys if key in recon_data}
 
 
 def run_domain_recon(target: str, anonymous: bool = False, bruteforce: bool = False,
-                     target_info: dict = None) -> dict:
+                     target_info: TargetInfo = None) -> dict:
     """
     Run combined WHOIS + subdomain discovery + DNS resolution.
     Produces a single unified JSON file with incremental saves.
@@ -191,25 +338,28 @@ def run_domain_recon(target: str, anonymous: bool = False, bruteforce: bool = Fa
     if target_info is None:
         target_info = parse_target(target, SUBDOMAIN_LIST)
 
-    filtered_mode = target_info["filtered_mode"]
-    root_domain = target_info["root_domain"]
-    full_subdomains = target_info["full_subdomains"]
+    filtered_mode = target_info.filtered_mode
+    root_domain = target_info.root_domain
+    full_subdomains = target_info.full_subdomains
 
-    print("\n" + "=" * 70)
-    print("               RedAmon - Domain Reconnaissance")
-    print("=" * 70)
-    print(f"  Target: {root_domain}")
+    header = [
+        "\n" + SECTION_RULE,
+        "               RedAmon - Domain Reconnaissance",
+        SECTION_RULE,
+        f"  Target: {root_domain}",
+    ]
     if filtered_mode:
-        print(f"  Mode: FILTERED SUBDOMAIN SCAN")
-        print(f"  Subdomains: {', '.join(full_subdomains)}")
+        header.append("  Mode: FILTERED SUBDOMAIN SCAN")
+        header.append(f"  Subdomains: {', '.join(full_subdomains)}")
     else:
-        print(f"  Mode: FULL DISCOVERY (all subdomains)")
-    print(f"  Anonymous Mode: {anonymous}")
+        header.append("  Mode: FULL DISCOVERY (all subdomains)")
+    header.append(f"  Anonymous Mode: {anonymous}")
     if not filtered_mode:
-        print(f"  Bruteforce Mode: {bruteforce}")
-    print(f"  WHOIS Retries: {_settings.get('WHOIS_RETRIES', 2)}")
-    print(f"  DNS Retries: {_settings.get('DNS_RETRIES', 2)}")
-    print("=" * 70 + "\n")
+        header.append(f"  Bruteforce Mode: {bruteforce}")
+    header.append(f"  WHOIS Retries: {_settings.get('WHOIS_RETRIES', 2)}")
+    header.append(f"  DNS Retries: {_settings.get('DNS_RETRIES', 2)}")
+    header.append(SECTION_RULE + "\n")
+    logger.info("\n".join(header))
 
     # Setup output file (use PROJECT_ID for filename)
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -219,11 +369,11 @@ def run_domain_recon(target: str, anonymous: bool = False, bruteforce: bool = Fa
     combined_result = {
         "metadata": {
             "scan_type": build_scan_type(),
-            "scan_timestamp": datetime.now().isoformat(),
+            "scan_timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
             "target": root_domain,
             "root_domain": root_domain,
             "filtered_mode": filtered_mode,
-            "subdomain_filter": full_subdomains if filtered_mode else [],
+            "subdomain_filter": list(full_subdomains) if filtered_mode else [],
             "anonymous_mode": anonymous,
             "bruteforce_mode": bruteforce if not filtered_mode else False,
             "modules_executed": []
@@ -235,102 +385,121 @@ def run_domain_recon(target: str, anonymous: bool = False, bruteforce: bool = Fa
         "dns": {}
     }
 
-    # Step 1: WHOIS lookup (always on root domain)
-    print("[PHASE 1] WHOIS Lookup")
-    print("-" * 40)
-    whois_target = root_domain
-    print(f"[*] Performing WHOIS on root domain: {whois_target}")
-    try:
-        whois_result = whois_lookup(whois_target, save_output=False, settings=_settings)
-        combined_result["whois"] = whois_result.get("whois_data", {})
-        print(f"[+] WHOIS data retrieved successfully")
-    except Exception as e:
-        print(f"[!] WHOIS lookup failed: {e}")
-        combined_result["whois"] = {"error": str(e)}
-
-    combined_result["metadata"]["modules_executed"].append("whois")
+    # Write the initial skeleton; it is replaced by the merged file after phase 2
     save_recon_file(combined_result, output_file)
-    print(f"[+] Saved: {output_file}")
+    get_delta_file(output_file).unlink(missing_ok=True)
 
-    # Step 2: Subdomain discovery & DNS resolution
-    if filtered_mode:
-        # FILTERED MODE: Only scan the specified subdomains from SUBDOMAIN_LIST
-        print(f"\n[PHASE 2] Filtered Subdomain DNS Resolution")
-        print("-" * 40)
-        print(f"[*] Resolving DNS for {len(full_subdomains)} specified host(s)")
+    # Step 1: WHOIS lookup (always on root domain)
+    # WHOIS has no data dependency on subdomain discovery, so it runs in the
+    # background during phase 2 and is collected once DNS resolution is done
+    logger.info("[PHASE 1] WHOIS Lookup")
+    logger.info(PHASE_RULE)
+    whois_target = root_domain
+    logger.info(f"[*] Performing WHOIS on root domain: {whois_target} (in background)")
+    from recon.whois_recon import whois_lookup
+    whois_executor = ThreadPoolExecutor(max_workers=1)
+    whois_future = whois_executor.submit(whois_lookup, whois_target, save_output=False, settings=_settings)
 
-        # Import dns_lookup from domain_recon
-        from recon.domain_recon import dns_lookup
+    # Phase 2 may raise; always release the WHOIS worker (a lookup that is
+    # still queued is cancelled rather than left to delay interpreter exit)
+    try:
+        # Step 2: Subdomain discovery & DNS resolution
+        if filtered_mode:
+            # FILTERED MODE: Only scan the specified subdomains from SUBDOMAIN_LIST
+            logger.info(f"\n[PHASE 2] Filtered Subdomain DNS Resolution")
+            logger.info(PHASE_RULE)
+            logger.info(f"[*] Resolving DNS for {len(full_subdomains)} specified host(s)")
+
+            # Import dns_lookup_many from domain_recon
+            from recon.domain_recon import dns_lookup_many
+
+            # Check if root domain should be included (via "." prefix)
+            include_root = target_info.include_root_domain
+
+            # Resolve root domain and all specified subdomains concurrently
+            subdomain_hosts = [sub for sub in full_subdomains if sub != root_domain]
+            dns_results = dns_lookup_many(([root_domain] if include_root else []) + subdomain_hosts)
+
+            # Root domain DNS if included
+            domain_dns = {}
+            if include_root:
+                logger.info(f"[*] Resolving root domain: {root_domain}")
+                domain_dns = dns_results[root_domain]
+                if domain_dns["ips"]["ipv4"] or domain_dns["ips"]["ipv6"]:
+                    all_ips = domain_dns["ips"]["ipv4"] + domain_dns["ips"]["ipv6"]
+                    logger.info(f"[+] {root_domain} -> {', '.join(all_ips)}")
+                else:
+                    logger.info(f"[-] {root_domain}: No DNS records found")
+
+            # Each specified subdomain (excluding root domain which is handled above)
+            subdomains_dns = {}
+            for subdomain in subdomain_hosts:
+                logger.info(f"[*] Resolving: {subdomain}")
+                subdomain_dns = dns_results[subdomain]
+                subdomains_dns[subdomain] = subdomain_dns
+
+                if subdomain_dns["ips"]["ipv4"] or subdomain_dns["ips"]["ipv6"]:
+                    all_ips = subdomain_dns["ips"]["ipv4"] + subdomain_dns["ips"]["ipv6"]
+                    logger.info(f"[+] {subdomain} -> {', '.join(all_ips)}")
+                else:
+                    logger.info(f"[-] {subdomain}: No DNS records found")
 
-        # Check if root domain should be included (via "." prefix)
-        include_root = target_info.get("include_root_domain", False)
-        
-        # Resolve root domain DNS if included
-        domain_dns = {}
-        if include_root:
-            print(f"[*] Resolving root domain: {root_domain}")
-            domain_dns = dns_lookup(root_domain)
-            if domain_dns["ips"]["ipv4"] or domain_dns["ips"]["ipv6"]:
-                all_ips = domain_dns["ips"]["ipv4"] + domain_dns["ips"]["ipv6"]
-                print(f"[+] {root_domain} -> {', '.join(all_ips)}")
-            else:
-                print(f"[-] {root_domain}: No DNS records found")
-
-        # Resolve each specified subdomain (excluding root domain which is handled above)
-        subdomains_dns = {}
-        for subdomain in full_subdomains:
-            # Skip root domain (already resolved above)
-            if subdomain == root_domain:
-                continue
-                
-            print(f"[*] Resolving: {subdomain}")
-            subdomain_dns = dns_lookup(subdomain)
-            subdomains_dns[subdomain] = subdomain_dns
-
-            if subdomain_dns["ips"]["ipv4"] or subdomain_dns["ips"]["ipv6"]:
-                all_ips = subdomain_dns["ips"]["ipv4"] + subdomain_dns["ips"]["ipv6"]
-                print(f"[+] {subdomain} -> {', '.join(all_ips)}")
-            else:
-                print(f"[-] {subdomain}: No DNS records found")
-
-        combined_result["subdomains"] = full_subdomains
-        combined_result["subdomain_count"] = len(full_subdomains)
-        combined_result["dns"] = {
-            "domain": domain_dns,  # Include root domain DNS if "." was in SUBDOMAIN_LIST
-            "subdomains": subdomains_dns
-        }
-        combined_result["metadata"]["include_root_domain"] = include_root
-
-        combined_result["metadata"]["modules_executed"].append("dns_resolution")
-    else:
-        # FULL DISCOVERY MODE: Discover all subdomains
-        print(f"\n[PHASE 2] Subdomain Discovery & DNS Resolution")
-        print("-" * 40)
-        recon_result = discover_subdomains(
-            root_domain,
-            anonymous=anonymous,
-            bruteforce=bruteforce,
-            resolve=True,
-            save_output=False
-        )
+            combined_result["subdomains"] = list(full_subdomains)
+            combined_result["subdomain_count"] = len(full_subdomains)
+            combined_result["dns"] = {
+                "domain": domain_dns,  # Include root domain DNS if "." was in SUBDOMAIN_LIST
+                "subdomains": subdomains_dns
+            }
+            combined_result["metadata"]["include_root_domain"] = include_root
 
-        combined_result["subdomains"] = recon_result.get("subdomains", [])
-        combined_result["subdomain_count"] = recon_result.get("subdomain_count", 0)
-        combined_result["metadata"]["modules_executed"].append("subdomain_discovery")
-        save_recon_file(combined_result, output_file)
-        print(f"[+] Saved: {output_file}")
+            combined_result["metadata"]["modules_executed"].append("dns_resolution")
+        else:
+            # FULL DISCOVERY MODE: Discover all subdomains
+            logger.info(f"\n[PHASE 2] Subdomain Discovery & DNS Resolution")
+            logger.info(PHASE_RULE)
+            from recon.domain_recon import discover_subdomains
+            recon_result = discover_subdomains(
+                root_domain,
+                anonymous=anonymous,
+                bruteforce=bruteforce,
+                resolve=True,
+                save_output=False
+            )
+
+            combined_result["subdomains"] = recon_result.get("subdomains", [])
+            combined_result["subdomain_count"] = recon_result.get("subdomain_count", 0)
+            combined_result["metadata"]["modules_executed"].append("subdomain_discovery")
+            save_phase_delta(output_file, "subdomain_discovery",
+                             _delta(combined_result, "subdomains", "subdomain_count"))
+            logger.info(f"[+] Saved: {get_delta_file(output_file)}")
+
+            # Step 3: DNS resolution (already done in discover_subdomains)
+            combined_result["dns"] = recon_result.get("dns", {})
+            combined_result["metadata"]["modules_executed"].append("dns_resolution")
+
+        # Collect the background WHOIS lookup started in phase 1
+        try:
+            whois_result = whois_future.result()
+            combined_result["whois"] = whois_result.get("whois_data", {})
+            logger.info(f"[+] WHOIS data retrieved successfully")
+        except Exception as e:
+            logger.info(f"[!] WHOIS lookup failed: {e}")
+            combined_result["whois"] = {"error": str(e)}
+    finally:
+        whois_executor.shutdown(wait=False, cancel_futures=True)
 
-        # Step 3: DNS resolution (already done in discover_subdomains)
-        combined_result["dns"] = recon_result.get("dns", {})
-        combined_result["metadata"]["modules_executed"].append("dns_resolution")
+    combined_result["metadata"]["modules_executed"].insert(0, "whois")
 
-    save_recon_file(combined_result, output_file)
-    print(f"[+] Saved: {output_file}")
+    # No phase module snapshots WHOIS/subdomains/DNS, and other services read
+    # recon_<id>.json directly, so write the merged file once discovery is done
+    # (this also resets the sidecar; later phases append deltas again)
+    finalize_recon_file(output_file, combined_result)
+    logger.info(f"[+] Saved: {output_file}")
 
     # Update Graph DB after domain_discovery completes
     if UPDATE_GRAPH_DB:
-        print(f"\n[PHASE 3] Graph Database Update")
-        print("-" * 40)
+        logger.info(f"\n[PHASE 3] Graph Database Update")
+        logger.info(PHASE_RULE)
         try:
             from graph_db import Neo4jClient
             with Neo4jClient() as graph_client:
@@ -338,30 +507,34 @@ def run_domain_recon(target: str, anonymous: bool = False, bruteforce: bool = Fa
                     stats = graph_client.update_graph_from_domain_discovery(combined_result, USER_ID, PROJECT_ID)
                     combined_result["metadata"]["graph_db_updated"] = True
                     combined_result["metadata"]["graph_db_stats"] = stats
-                    print(f"[+] Graph database updated successfully")
+                    logger.info(f"[+] Graph database updated successfully")
                 else:
-                    print(f"[!] Could not connect to Neo4j - skipping graph update")
+                    logger.info(f"[!] Could not connect to Neo4j - skipping graph update")
                     combined_result["metadata"]["graph_db_updated"] = False
         except ImportError:
-            print(f"[!] Neo4j client not available - skipping graph update")
+            logger.info(f"[!] Neo4j client not available - skipping graph update")
             combined_result["metadata"]["graph_db_updated"] = False
         except Exception as e:
-            print(f"[!] Graph DB update failed: {e}")
+            logger.info(f"[!] Graph DB update failed: {e}")
             combined_result["metadata"]["graph_db_updated"] = False
             combined_result["metadata"]["graph_db_error"] = str(e)
 
-        save_recon_file(combined_result, output_file)
+        save_phase_delta(output_file, "graph_db", _delta(combined_result))
+
+    # Phase modules enrich combined_result in place (each adds its own top-level
+    # key), so the orchestrator keeps a single dict instead of reassigning it
 
     # Step 3: Port scanning (fast port discovery)
-    if "port_scan" in SCAN_MODULES:
-        combined_result = run_port_scan(combined_result, output_file=output_file, settings=_settings)
+    if "port_scan" in ENABLED_MODULES:
+        from recon.port_scan import run_port_scan
+        run_port_scan(combined_result, output_file=output_file, settings=_settings)
         combined_result["metadata"]["modules_executed"].append("port_scan")
-        save_recon_file(combined_result, output_file)
+        save_phase_delta(output_file, "port_scan", _delta(combined_result, "port_scan"))
 
         # Update Graph DB with port scan data
         if UPDATE_GRAPH_DB:
-            print(f"\n[GRAPH UPDATE] Port Scan Data")
-            print("-" * 40)
+            logger.info(f"\n[GRAPH UPDATE] Port Scan Data")
+            logger.info(PHASE_RULE)
             try:
                 from graph_db import Neo4jClient
                 with Neo4jClient() as graph_client:
@@ -369,30 +542,31 @@ def run_domain_recon(target: str, anonymous: bool = False, bruteforce: bool = Fa
                         port_stats = graph_client.update_graph_from_port_scan(combined_result, USER_ID, PROJECT_ID)
                         combined_result["metadata"]["graph_db_port_scan_updated"] = True
                         combined_result["metadata"]["graph_db_port_scan_stats"] = port_stats
-                        print(f"[+] Graph database updated with port scan data")
+                        logger.info(f"[+] Graph database updated with port scan data")
                     else:
-                        print(f"[!] Could not connect to Neo4j - skipping port scan graph update")
+                        logger.info(f"[!] Could not connect to Neo4j - skipping port scan graph update")
                         combined_result["metadata"]["graph_db_port_scan_updated"] = False
             except ImportError:
-                print(f"[!] Neo4j client not available - skipping port scan graph update")
+                logger.info(f"[!] Neo4j client not available - skipping port scan graph update")
                 combined_result["metadata"]["graph_db_port_scan_updated"] = False
             except Exception as e:
-                print(f"[!] Port scan graph update failed: {e}")
+                logger.info(f"[!] Port scan graph update failed: {e}")
                 combined_result["metadata"]["graph_db_port_scan_updated"] = False
                 combined_result["metadata"]["graph_db_port_scan_error"] = str(e)
 
-            save_recon_file(combined_result, output_file)
+            save_phase_delta(output_file, "graph_db_port_scan", _delta(combined_result))
 
     # Step 4: HTTP probing (technology detection, live URL discovery)
-    if "http_probe" in SCAN_MODULES:
-        combined_result = run_http_probe(combined_result, output_file=output_file, settings=_settings)
+    if "http_probe" in ENABLED_MODULES:
+        from recon.http_probe import run_http_probe
+        run_http_probe(combined_result, output_file=output_file, settings=_settings)
         combined_result["metadata"]["modules_executed"].append("http_probe")
-        save_recon_file(combined_result, output_file)
+        save_phase_delta(output_file, "http_probe", _delta(combined_result, "http_probe", "banner_grab"))
 
         # Update Graph DB with http probe data
         if UPDATE_GRAPH_DB:
-            print(f"\n[GRAPH UPDATE] HTTP Probe Data")
-            print("-" * 40)
+            logger.info(f"\n[GRAPH UPDATE] HTTP Probe Data")
+            logger.info(PHASE_RULE)
             try:
                 from graph_db import Neo4jClient
                 with Neo4jClient() as graph_client:
@@ -400,43 +574,44 @@ def run_domain_recon(target: str, anonymous: bool = False, bruteforce: bool = Fa
                         http_stats = graph_client.update_graph_from_http_probe(combined_result, USER_ID, PROJECT_ID)
                         combined_result["metadata"]["graph_db_http_probe_updated"] = True
                         combined_result["metadata"]["graph_db_http_probe_stats"] = http_stats
-                        print(f"[+] Graph database updated with http probe data")
+                        logger.info(f"[+] Graph database updated with http probe data")
                     else:
-                        print(f"[!] Could not connect to Neo4j - skipping http probe graph update")
+                        logger.info(f"[!] Could not connect to Neo4j - skipping http probe graph update")
                         combined_result["metadata"]["graph_db_http_probe_updated"] = False
             except ImportError:
-                print(f"[!] Neo4j client not available - skipping http probe graph update")
+                logger.info(f"[!] Neo4j client not available - skipping http probe graph update")
                 combined_result["metadata"]["graph_db_http_probe_updated"] = False
             except Exception as e:
-                print(f"[!] HTTP probe graph update failed: {e}")
+                logger.info(f"[!] HTTP probe graph update failed: {e}")
                 combined_result["metadata"]["graph_db_http_probe_updated"] = False
                 combined_result["metadata"]["graph_db_http_probe_error"] = str(e)
 
-            save_recon_file(combined_result, output_file)
+            save_phase_delta(output_file, "graph_db_http_probe", _delta(combined_result))
 
     # Check if we should skip active scanning modules (resource_enum, vuln_scan)
     # These require live targets from http_probe to work
     skip_active_scans, skip_reason = should_skip_active_scans(combined_result)
     
     if skip_active_scans:
-        print(f"\n{'=' * 70}")
-        print(f"[!] SKIPPING ACTIVE SCANS: {skip_reason}")
-        print(f"[!] Modules skipped: resource_enum, vuln_scan")
-        print(f"{'=' * 70}")
+        logger.info("\n" + SECTION_RULE)
+        logger.info(f"[!] SKIPPING ACTIVE SCANS: {skip_reason}")
+        logger.info(f"[!] Modules skipped: resource_enum, vuln_scan")
+        logger.info(SECTION_RULE)
         combined_result["metadata"]["active_scans_skipped"] = True
         combined_result["metadata"]["active_scans_skip_reason"] = skip_reason
-        save_recon_file(combined_result, output_file)
+        save_phase_delta(output_file, "active_scans_skipped", _delta(combined_result))
     else:
         # Step 5: Resource enumeration (endpoint discovery & classification)
-        if "resource_enum" in SCAN_MODULES:
-            combined_result = run_resource_enum(combined_result, output_file=output_file, settings=_settings)
+        if "resource_enum" in ENABLED_MODULES:
+            from recon.resource_enum import run_resource_enum
+            run_resource_enum(combined_result, output_file=output_file, settings=_settings)
             combined_result["metadata"]["modules_executed"].append("resource_enum")
-            save_recon_file(combined_result, output_file)
+            save_phase_delta(output_file, "resource_enum", _delta(combined_result, "resource_enum"))
 
             # Update Graph DB with resource enumeration data
             if UPDATE_GRAPH_DB:
-                print(f"\n[GRAPH UPDATE] Resource Enumeration Data")
-                print("-" * 40)
+                logger.info(f"\n[GRAPH UPDATE] Resource Enumeration Data")
+                logger.info(PHASE_RULE)
                 try:
                     from graph_db import Neo4jClient
                     with Neo4jClient() as graph_client:
@@ -444,34 +619,38 @@ def run_domain_recon(target: str, anonymous: bool = False, bruteforce: bool = Fa
                             resource_stats = graph_client.update_graph_from_resource_enum(combined_result, USER_ID, PROJECT_ID)
                             combined_result["metadata"]["graph_db_resource_enum_updated"] = True
                             combined_result["metadata"]["graph_db_resource_enum_stats"] = resource_stats
-                            print(f"[+] Graph database updated with resource enumeration data")
+                            logger.info(f"[+] Graph database updated with resource enumeration data")
                         else:
-                            print(f"[!] Could not connect to Neo4j - skipping resource enum graph update")
+                            logger.info(f"[!] Could not connect to Neo4j - skipping resource enum graph update")
                             combined_result["metadata"]["graph_db_resource_enum_updated"] = False
                 except ImportError:
-                    print(f"[!] Neo4j client not available - skipping resource enum graph update")
+                    logger.info(f"[!] Neo4j client not available - skipping resource enum graph update")
                     combined_result["metadata"]["graph_db_resource_enum_updated"] = False
                 except Exception as e:
-                    print(f"[!] Resource enum graph update failed: {e}")
+                    logger.info(f"[!] Resource enum graph update failed: {e}")
                     combined_result["metadata"]["graph_db_resource_enum_updated"] = False
                     combined_result["metadata"]["graph_db_resource_enum_error"] = str(e)
 
-                save_recon_file(combined_result, output_file)
+                save_phase_delta(output_file, "graph_db_resource_enum", _delta(combined_result))
 
         # Step 6: Vulnerability scanning (web application vulns) + MITRE enrichment
-        if "vuln_scan" in SCAN_MODULES:
-            combined_result = run_vuln_scan(combined_result, output_file=output_file, settings=_settings)
+        if "vuln_scan" in ENABLED_MODULES:
+            from recon.vuln_scan import run_vuln_scan
+            from recon.add_mitre import run_mitre_enrichment
+            run_vuln_scan(combined_result, output_file=output_file, settings=_settings)
             combined_result["metadata"]["modules_executed"].append("vuln_scan")
-            save_recon_file(combined_result, output_file)
+            save_phase_delta(output_file, "vuln_scan", _delta(combined_result, "vuln_scan", "technology_cves"))
 
             # Automatically run MITRE CWE/CAPEC enrichment after vuln_scan
-            combined_result = run_mitre_enrichment(combined_result, output_file=output_file, settings=_settings)
-            save_recon_file(combined_result, output_file)
+            run_mitre_enrichment(combined_result, output_file=output_file, settings=_settings)
+            if combined_result["metadata"].get("mitre_enrichment"):
+                combined_result["metadata"]["modules_executed"].append("add_mitre")
+            save_phase_delta(output_file, "add_mitre", _delta(combined_result, "vuln_scan", "technology_cves"))
 
             # Update Graph DB with vuln scan data
             if UPDATE_GRAPH_DB:
-                print(f"\n[GRAPH UPDATE] Vuln Scan Data")
-                print("-" * 40)
+                logger.info(f"\n[GRAPH UPDATE] Vuln Scan Data")
+                logger.info(PHASE_RULE)
                 try:
                     from graph_db import Neo4jClient
                     with Neo4jClient() as graph_client:
@@ -479,70 +658,128 @@ def run_domain_recon(target: str, anonymous: bool = False, bruteforce: bool = Fa
                             vuln_stats = graph_client.update_graph_from_vuln_scan(combined_result, USER_ID, PROJECT_ID)
                             combined_result["metadata"]["graph_db_vuln_scan_updated"] = True
                             combined_result["metadata"]["graph_db_vuln_scan_stats"] = vuln_stats
-                            print(f"[+] Graph database updated with vuln scan data")
+                            logger.info(f"[+] Graph database updated with vuln scan data")
                         else:
-                            print(f"[!] Could not connect to Neo4j - skipping vuln scan graph update")
+                            logger.info(f"[!] Could not connect to Neo4j - skipping vuln scan graph update")
                             combined_result["metadata"]["graph_db_vuln_scan_updated"] = False
                 except ImportError:
-                    print(f"[!] Neo4j client not available - skipping vuln scan graph update")
+                    logger.info(f"[!] Neo4j client not available - skipping vuln scan graph update")
                     combined_result["metadata"]["graph_db_vuln_scan_updated"] = False
                 except Exception as e:
-                    print(f"[!] Vuln scan graph update failed: {e}")
+                    logger.info(f"[!] Vuln scan graph update failed: {e}")
                     combined_result["metadata"]["graph_db_vuln_scan_updated"] = False
                     combined_result["metadata"]["graph_db_vuln_scan_error"] = str(e)
 
-                save_recon_file(combined_result, output_file)
+                save_phase_delta(output_file, "graph_db_vuln_scan", _delta(combined_result))
+
+    # Materialize the merged recon JSON once (in-memory data holds all deltas)
+    finalize_recon_file(output_file, combined_result)
 
     # Print summary
-    print(f"\n{'=' * 70}")
-    print(f"[+] DOMAIN RECON COMPLETE")
+    logger.info("\n" + SECTION_RULE)
+    logger.info(f"[+] DOMAIN RECON COMPLETE")
     if filtered_mode:
-        print(f"[+] Mode: Filtered ({len(full_subdomains)} subdomain(s))")
+        logger.info(f"[+] Mode: Filtered ({len(full_subdomains)} subdomain(s))")
     else:
-        print(f"[+] Subdomains found: {combined_result['subdomain_count']}")
+        logger.info(f"[+] Subdomains found: {combined_result['subdomain_count']}")
     
     # Port scan stats
-    if "port_scan" in SCAN_MODULES and "port_scan" in combined_result:
+    if "port_scan" in ENABLED_MODULES and "port_scan" in combined_result:
         port_summary = combined_result["port_scan"].get("summary", {})
-        print(f"[+] Open ports: {port_summary.get('total_open_ports', 0)}")
+        logger.info(f"[+] Open ports: {port_summary.get('total_open_ports', 0)}")
     
     # HTTP probe stats
-    if "http_probe" in SCAN_MODULES and "http_probe" in combined_result:
+    if "http_probe" in ENABLED_MODULES and "http_probe" in combined_result:
         http_summary = combined_result["http_probe"].get("summary", {})
-        print(f"[+] Live URLs: {http_summary.get('live_urls', 0)}")
-        print(f"[+] Technologies: {http_summary.get('technology_count', 0)}")
+        logger.info(f"[+] Live URLs: {http_summary.get('live_urls', 0)}")
+        logger.info(f"[+] Technologies: {http_summary.get('technology_count', 0)}")
 
     # Check if active scans were skipped
     active_scans_skipped = combined_result.get("metadata", {}).get("active_scans_skipped", False)
 
     # Resource enumeration stats
     if active_scans_skipped:
-        print(f"[!] Resource enum: SKIPPED (no live targets)")
-    elif "resource_enum" in SCAN_MODULES and "resource_enum" in combined_result:
+        logger.info(f"[!] Resource enum: SKIPPED (no live targets)")
+    elif "resource_enum" in ENABLED_MODULES and "resource_enum" in combined_result:
         resource_summary = combined_result["resource_enum"].get("summary", {})
-        print(f"[+] Endpoints: {resource_summary.get('total_endpoints', 0)}")
-        print(f"[+] Parameters: {resource_summary.get('total_parameters', 0)}")
-        print(f"[+] Forms (POST): {resource_summary.get('total_forms', 0)}")
+        logger.info(f"[+] Endpoints: {resource_summary.get('total_endpoints', 0)}")
+        logger.info(f"[+] Parameters: {resource_summary.get('total_parameters', 0)}")
+        logger.info(f"[+] Forms (POST): {resource_summary.get('total_forms', 0)}")
 
     # Vuln scan stats (includes MITRE enrichment)
     if active_scans_skipped:
-        print(f"[!] Vuln scan: SKIPPED (no live targets)")
-    elif "vuln_scan" in SCAN_MODULES and "vuln_scan" in combined_result:
+        logger.info(f"[!] Vuln scan: SKIPPED (no live targets)")
+    elif "vuln_scan" in ENABLED_MODULES and "vuln_scan" in combined_result:
         vuln_summary = combined_result["vuln_scan"].get("summary", {})
         vuln_total = combined_result["vuln_scan"].get("vulnerabilities", {}).get("total", 0)
-        print(f"[+] Vuln findings: {vuln_summary.get('total_findings', 0)} ({vuln_total} vulnerabilities)")
+        logger.info(f"[+] Vuln findings: {vuln_summary.get('total_findings', 0)} ({vuln_total} vulnerabilities)")
 
         # MITRE enrichment stats (part of vuln_scan)
         mitre_meta = combined_result.get("metadata", {}).get("mitre_enrichment", {})
         if mitre_meta:
-            print(f"[+] MITRE enriched: {mitre_meta.get('total_cves_enriched', 0)}/{mitre_meta.get('total_cves_processed', 0)} CVEs")
+            logger.info(f"[+] MITRE enriched: {mitre_meta.get('total_cves_enriched', 0)}/{mitre_meta.get('total_cves_processed', 0)} CVEs")
 
-    print(f"[+] Output saved: {output_file}")
-    print(f"{'=' * 70}")
+    logger.info(f"[+] Output saved: {output_file}")
+    logger.info(SECTION_RULE)
 
     return combined_result
 
 
+def _port_summary(recon_data: dict) -> str:
+    port_summary = recon_data["port_scan"].get("summary", {})
+    ports = port_summary.get('total_open_ports', 0)
+    hosts = port_summary.get('hosts_with_open_ports', 0)
+    return f"{hosts} hosts, {ports} ports"
+
+
+def _http_summary(recon_data: dict) -> str:
+    http_summary = recon_data["http_probe"].get("summary", {})
+    live = http_summary.get('live_urls', 0)
+    techs = http_summary.get('technology_count', 0)
+    return f"{live} live URLs, {techs} technologies"
+
+
+def _resource_summary(recon_data: dict) -> str:
+    res_summary = recon_data["resource_enum"].get("summary", {})
+    endpoints = res_summary.get('total_endpoints', 0)
+    params = res_summary.get('total_parameters', 0)
+    forms = res_summary.get('total_forms', 0)
+    return f"{endpoints} endpoints, {params} params, {forms} forms"
+
+
+def _vuln_summary(recon_data: dict) -> str:
+    vuln_summary = recon_data["vuln_scan"].get("summary", {})
+    total_findings = vuln_summary.get("total_findings", 0)
+    crit = vuln_summary.get("critical", 0)
+    high = vuln_summary.get("high", 0)
+    vuln_info = f"{total_findings} findings"
+    if crit > 0 or high > 0:
+        vuln_info += f" ({crit} critical, {high} high)"
+    return vuln_info
+
+
+def _mitre_summary(recon_data: dict) -> Optional[str]:
+    # MITRE enrichment stats (part of vuln_scan); no line when nothing was enriched
+    mitre_meta = recon_data.get("metadata", {}).get("mitre_enrichment", {})
+    if not mitre_meta:
+        return None
+    enriched = mitre_meta.get('total_cves_enriched', 0)
+    total = mitre_meta.get('total_cves_processed', 0)
+    return f"{enriched}/{total} CVEs enriched"
+
+
+# Final summary rows:
+# (label, stats getter, module key, skipped when no live targets, report skips)
+# A getter returning None omits its row.
+SUMMARY_ROWS = (
+    ("Port Scan", _port_summary, "port_scan", False, True),
+    ("HTTP Probe", _http_summary, "http_probe", False, True),
+    ("Resources", _resource_summary, "resource_enum", True, True),
+    ("Vuln Scan", _vuln_summary, "vuln_scan", True, True),
+    ("MITRE CWE/CAPEC", _mitre_summary, "vuln_scan", True, False),
+)
+
+
 def main():
     """
     Main entry point - runs the complete recon pipeline.
@@ -553,19 +790,16 @@ def main():
     - Empty list []: Full subdomain discovery (discover and scan all subdomains)
     - With entries ["testphp.", "www."]: Filtered mode (only scan specified subdomains)
     """
-    print("\n")
-    print("╔" + "═" * 68 + "╗")
-    print("║" + " " * 20 + "RedAmon OSINT Framework" + " " * 25 + "║")
-    print("║" + " " * 15 + "Automated Reconnaissance Pipeline" + " " * 18 + "║")
-    print("╚" + "═" * 68 + "╝")
-    print()
+    logger.info("\n".join(["\n", BANNER_TOP, BANNER_TITLE, BANNER_SUBTITLE, BANNER_BOT, ""]))
 
-    start_time = datetime.now()
+    # Monotonic clock for duration; wall-clock timestamps only go into the output file
+    start_time = time.monotonic()
 
     # Domain Ownership Verification (if enabled)
     # This MUST be the first check before any scanning to ensure we only
     # scan domains the user controls.
     if VERIFY_DOMAIN_OWNERSHIP:
+        from recon.domain_recon import verify_domain_ownership
         ownership_result = verify_domain_ownership(
             TARGET_DOMAIN,
             OWNERSHIP_TOKEN,
@@ -573,48 +807,50 @@ def main():
         )
 
         if not ownership_result["verified"]:
-            print(f"\n[!] SCAN ABORTED: Domain ownership verification failed!")
-            print(f"[!] Add TXT record: {ownership_result['record_name']} → \"{ownership_result['expected_value']}\"")
-            print(f"[!] Set VERIFY_DOMAIN_OWNERSHIP = False in params.py to disable\n")
+            logger.info(f"\n[!] SCAN ABORTED: Domain ownership verification failed!")
+            logger.info(f"[!] Add TXT record: {ownership_result['record_name']} → \"{ownership_result['expected_value']}\"")
+            logger.info(f"[!] Set VERIFY_DOMAIN_OWNERSHIP = False in params.py to disable\n")
             return 1
 
     # Parse target with SUBDOMAIN_LIST filter
     target_info = parse_target(TARGET_DOMAIN, SUBDOMAIN_LIST)
-    filtered_mode = target_info["filtered_mode"]
-    root_domain = target_info["root_domain"]
-    full_subdomains = target_info["full_subdomains"]
+    filtered_mode = target_info.filtered_mode
+    root_domain = target_info.root_domain
+    full_subdomains = target_info.full_subdomains
 
     # Display full configuration (values loaded from DB/API)
-    print("═" * 63)
-    print("Configuration:")
-    print(f"  TARGET_DOMAIN:     {TARGET_DOMAIN}")
-    print(f"  SUBDOMAIN_LIST:    {SUBDOMAIN_LIST if SUBDOMAIN_LIST else '[] (full discovery)'}")
-    print(f"  SCAN_MODULES:      {','.join(SCAN_MODULES) if isinstance(SCAN_MODULES, list) else SCAN_MODULES}")
-    print(f"  USE_TOR_FOR_RECON: {USE_TOR_FOR_RECON}")
-    print(f"  UPDATE_GRAPH_DB:   {UPDATE_GRAPH_DB}")
-    print(f"  USER_ID:           {USER_ID}")
-    print(f"  PROJECT_ID:        {PROJECT_ID}")
+    config_lines = [
+        CONFIG_RULE,
+        "Configuration:",
+        f"  TARGET_DOMAIN:     {TARGET_DOMAIN}",
+        f"  SUBDOMAIN_LIST:    {SUBDOMAIN_LIST if SUBDOMAIN_LIST else '[] (full discovery)'}",
+        f"  SCAN_MODULES:      {','.join(SCAN_MODULES) if isinstance(SCAN_MODULES, list) else SCAN_MODULES}",
+        f"  USE_TOR_FOR_RECON: {USE_TOR_FOR_RECON}",
+        f"  UPDATE_GRAPH_DB:   {UPDATE_GRAPH_DB}",
+        f"  USER_ID:           {USER_ID}",
+        f"  PROJECT_ID:        {PROJECT_ID}",
+    ]
     if filtered_mode:
-        print(f"  MODE:              FILTERED SUBDOMAIN SCAN")
-        print(f"  SUBDOMAINS:        {', '.join(full_subdomains)}")
+        config_lines.append("  MODE:              FILTERED SUBDOMAIN SCAN")
+        config_lines.append(f"  SUBDOMAINS:        {', '.join(full_subdomains)}")
     else:
-        print(f"  MODE:              FULL DISCOVERY (all subdomains)")
-    print("═" * 63)
-    print()
+        config_lines.append("  MODE:              FULL DISCOVERY (all subdomains)")
+    config_lines += [CONFIG_RULE, ""]
+    logger.info("\n".join(config_lines))
 
     # Clear previous graph data for this project before starting new scan
     if UPDATE_GRAPH_DB:
-        print("[*] Clearing previous graph data for this project...")
+        logger.info("[*] Clearing previous graph data for this project...")
         try:
             from graph_db import Neo4jClient
             with Neo4jClient() as graph_client:
                 if graph_client.verify_connection():
                     clear_stats = graph_client.clear_project_data(USER_ID, PROJECT_ID)
-                    print(f"[+] Previous data cleared: {clear_stats['nodes_deleted']} nodes removed\n")
+                    logger.info(f"[+] Previous data cleared: {clear_stats['nodes_deleted']} nodes removed\n")
                 else:
-                    print("[!] Could not connect to Neo4j - skipping clear\n")
+                    logger.info("[!] Could not connect to Neo4j - skipping clear\n")
         except Exception as e:
-            print(f"[!] Failed to clear previous graph data: {e}\n")
+            logger.info(f"[!] Failed to clear previous graph data: {e}\n")
 
     # Check anonymity status if Tor is enabled
     if USE_TOR_FOR_RECON:
@@ -622,12 +858,12 @@ def main():
             from recon.helpers.anonymity import print_anonymity_status
             print_anonymity_status()
         except ImportError:
-            print("[!] Anonymity module not found, proceeding without Tor status check")
+            logger.info("[!] Anonymity module not found, proceeding without Tor status check")
 
     # Phase 1 & 2: Domain recon (WHOIS + Subdomains + DNS) - Combined JSON
-    output_file = Path(__file__).parent / "output" / f"recon_{PROJECT_ID}.json"
+    output_file = OUTPUT_DIR / f"recon_{PROJECT_ID}.json"
 
-    if "domain_discovery" in SCAN_MODULES:
+    if "domain_discovery" in ENABLED_MODULES:
         domain_result = run_domain_recon(
             TARGET_DOMAIN,
             anonymous=USE_TOR_FOR_RECON,
@@ -637,27 +873,29 @@ def main():
     else:
         # Load existing recon file if domain_discovery not in modules
         if output_file.exists():
-            with open(output_file, 'r') as f:
-                domain_result = json.load(f)
-            print(f"[*] Loaded existing recon file: {output_file}")
+            # Also merges any phase deltas left behind by an interrupted run
+            domain_result = finalize_recon_file(output_file)
+            logger.info(f"[*] Loaded existing recon file: {output_file}")
         else:
-            print(f"[!] No existing recon file found: {output_file}")
-            print(f"[!] Add 'domain_discovery' to SCAN_MODULES to create it first")
+            logger.info(f"[!] No existing recon file found: {output_file}")
+            logger.info(f"[!] Add 'domain_discovery' to SCAN_MODULES to create it first")
             return 1
         
+        # Phase modules enrich domain_result in place
         # Run port_scan if in SCAN_MODULES (when domain_discovery is skipped)
-        if "port_scan" in SCAN_MODULES:
-            domain_result = run_port_scan(domain_result, output_file=output_file, settings=_settings)
-            if "metadata" in domain_result and "modules_executed" in domain_result["metadata"]:
-                if "port_scan" not in domain_result["metadata"]["modules_executed"]:
-                    domain_result["metadata"]["modules_executed"].append("port_scan")
-            with open(output_file, 'w') as f:
-                json.dump(domain_result, f, indent=2)
+        if "port_scan" in ENABLED_MODULES:
+            if should_run_phase(domain_result, "port_scan"):
+                from recon.port_scan import run_port_scan
+                run_port_scan(domain_result, output_file=output_file, settings=_settings)
+                if "metadata" in domain_result and "modules_executed" in domain_result["metadata"]:
+                    if "port_scan" not in domain_result["metadata"]["modules_executed"]:
+                        domain_result["metadata"]["modules_executed"].append("port_scan")
+                save_phase_delta(output_file, "port_scan", _delta(domain_result, "port_scan"))
 
             # Update Graph DB with port scan data
             if UPDATE_GRAPH_DB:
-                print(f"\n[GRAPH UPDATE] Port Scan Data")
-                print("-" * 40)
+                logger.info(f"\n[GRAPH UPDATE] Port Scan Data")
+                logger.info(PHASE_RULE)
                 try:
                     from graph_db import Neo4jClient
                     with Neo4jClient() as graph_client:
@@ -665,34 +903,34 @@ def main():
                             port_stats = graph_client.update_graph_from_port_scan(domain_result, USER_ID, PROJECT_ID)
                             domain_result["metadata"]["graph_db_port_scan_updated"] = True
                             domain_result["metadata"]["graph_db_port_scan_stats"] = port_stats
-                            print(f"[+] Graph database updated with port scan data")
+                            logger.info(f"[+] Graph database updated with port scan data")
                         else:
-                            print(f"[!] Could not connect to Neo4j - skipping port scan graph update")
+                            logger.info(f"[!] Could not connect to Neo4j - skipping port scan graph update")
                             domain_result["metadata"]["graph_db_port_scan_updated"] = False
                 except ImportError:
-                    print(f"[!] Neo4j client not available - skipping port scan graph update")
+                    logger.info(f"[!] Neo4j client not available - skipping port scan graph update")
                     domain_result["metadata"]["graph_db_port_scan_updated"] = False
                 except Exception as e:
-                    print(f"[!] Port scan graph update failed: {e}")
+                    logger.info(f"[!] Port scan graph update failed: {e}")
                     domain_result["metadata"]["graph_db_port_scan_updated"] = False
                     domain_result["metadata"]["graph_db_port_scan_error"] = str(e)
 
-                with open(output_file, 'w') as f:
-                    json.dump(domain_result, f, indent=2)
+                save_phase_delta(output_file, "graph_db_port_scan", _delta(domain_result))
         
         # Run http_probe if in SCAN_MODULES (when domain_discovery is skipped)
-        if "http_probe" in SCAN_MODULES:
-            domain_result = run_http_probe(domain_result, output_file=output_file, settings=_settings)
-            if "metadata" in domain_result and "modules_executed" in domain_result["metadata"]:
-                if "http_probe" not in domain_result["metadata"]["modules_executed"]:
-                    domain_result["metadata"]["modules_executed"].append("http_probe")
-            with open(output_file, 'w') as f:
-                json.dump(domain_result, f, indent=2)
+        if "http_probe" in ENABLED_MODULES:
+            if should_run_phase(domain_result, "http_probe"):
+                from recon.http_probe import run_http_probe
+                run_http_probe(domain_result, output_file=output_file, settings=_settings)
+                if "metadata" in domain_result and "modules_executed" in domain_result["metadata"]:
+                    if "http_probe" not in domain_result["metadata"]["modules_executed"]:
+                        domain_result["metadata"]["modules_executed"].append("http_probe")
+                save_phase_delta(output_file, "http_probe", _delta(domain_result, "http_probe", "banner_grab"))
 
             # Update Graph DB with http probe data
             if UPDATE_GRAPH_DB:
-                print(f"\n[GRAPH UPDATE] HTTP Probe Data")
-                print("-" * 40)
+                logger.info(f"\n[GRAPH UPDATE] HTTP Probe Data")
+                logger.info(PHASE_RULE)
                 try:
                     from graph_db import Neo4jClient
                     with Neo4jClient() as graph_client:
@@ -700,49 +938,48 @@ def main():
                             http_stats = graph_client.update_graph_from_http_probe(domain_result, USER_ID, PROJECT_ID)
                             domain_result["metadata"]["graph_db_http_probe_updated"] = True
                             domain_result["metadata"]["graph_db_http_probe_stats"] = http_stats
-                            print(f"[+] Graph database updated with http probe data")
+                            logger.info(f"[+] Graph database updated with http probe data")
                         else:
-                            print(f"[!] Could not connect to Neo4j - skipping http probe graph update")
+                            logger.info(f"[!] Could not connect to Neo4j - skipping http probe graph update")
                             domain_result["metadata"]["graph_db_http_probe_updated"] = False
                 except ImportError:
-                    print(f"[!] Neo4j client not available - skipping http probe graph update")
+                    logger.info(f"[!] Neo4j client not available - skipping http probe graph update")
                     domain_result["metadata"]["graph_db_http_probe_updated"] = False
                 except Exception as e:
-                    print(f"[!] HTTP probe graph update failed: {e}")
+                    logger.info(f"[!] HTTP probe graph update failed: {e}")
                     domain_result["metadata"]["graph_db_http_probe_updated"] = False
                     domain_result["metadata"]["graph_db_http_probe_error"] = str(e)
 
-                with open(output_file, 'w') as f:
-                    json.dump(domain_result, f, indent=2)
+                save_phase_delta(output_file, "graph_db_http_probe", _delta(domain_result))
 
         # Check if we should skip active scanning modules (resource_enum, vuln_scan)
         # These require live targets from http_probe to work
         skip_active_scans, skip_reason = should_skip_active_scans(domain_result)
         
         if skip_active_scans:
-            print(f"\n{'=' * 70}")
-            print(f"[!] SKIPPING ACTIVE SCANS: {skip_reason}")
-            print(f"[!] Modules skipped: resource_enum, vuln_scan")
-            print(f"{'=' * 70}")
+            logger.info("\n" + SECTION_RULE)
+            logger.info(f"[!] SKIPPING ACTIVE SCANS: {skip_reason}")
+            logger.info(f"[!] Modules skipped: resource_enum, vuln_scan")
+            logger.info(SECTION_RULE)
             if "metadata" in domain_result:
                 domain_result["metadata"]["active_scans_skipped"] = True
                 domain_result["metadata"]["active_scans_skip_reason"] = skip_reason
-            with open(output_file, 'w') as f:
-                json.dump(domain_result, f, indent=2)
+            save_phase_delta(output_file, "active_scans_skipped", _delta(domain_result))
         else:
             # Run resource_enum if in SCAN_MODULES (when domain_discovery is skipped)
-            if "resource_enum" in SCAN_MODULES:
-                domain_result = run_resource_enum(domain_result, output_file=output_file, settings=_settings)
-                if "metadata" in domain_result and "modules_executed" in domain_result["metadata"]:
-                    if "resource_enum" not in domain_result["metadata"]["modules_executed"]:
-                        domain_result["metadata"]["modules_executed"].append("resource_enum")
-                with open(output_file, 'w') as f:
-                    json.dump(domain_result, f, indent=2)
+            if "resource_enum" in ENABLED_MODULES:
+                if should_run_phase(domain_result, "resource_enum"):
+                    from recon.resource_enum import run_resource_enum
+                    run_resource_enum(domain_result, output_file=output_file, settings=_settings)
+                    if "metadata" in domain_result and "modules_executed" in domain_result["metadata"]:
+                        if "resource_enum" not in domain_result["metadata"]["modules_executed"]:
+                            domain_result["metadata"]["modules_executed"].append("resource_enum")
+                    save_phase_delta(output_file, "resource_enum", _delta(domain_result, "resource_enum"))
 
                 # Update Graph DB with resource enumeration data
                 if UPDATE_GRAPH_DB:
-                    print(f"\n[GRAPH UPDATE] Resource Enumeration Data")
-                    print("-" * 40)
+                    logger.info(f"\n[GRAPH UPDATE] Resource Enumeration Data")
+                    logger.info(PHASE_RULE)
                     try:
                         from graph_db import Neo4jClient
                         with Neo4jClient() as graph_client:
@@ -750,40 +987,50 @@ def main():
                                 resource_stats = graph_client.update_graph_from_resource_enum(domain_result, USER_ID, PROJECT_ID)
                                 domain_result["metadata"]["graph_db_resource_enum_updated"] = True
                                 domain_result["metadata"]["graph_db_resource_enum_stats"] = resource_stats
-                                print(f"[+] Graph database updated with resource enumeration data")
+                                logger.info(f"[+] Graph database updated with resource enumeration data")
                             else:
-                                print(f"[!] Could not connect to Neo4j - skipping resource enum graph update")
+                                logger.info(f"[!] Could not connect to Neo4j - skipping resource enum graph update")
                                 domain_result["metadata"]["graph_db_resource_enum_updated"] = False
                     except ImportError:
-                        print(f"[!] Neo4j client not available - skipping resource enum graph update")
+                        logger.info(f"[!] Neo4j client not available - skipping resource enum graph update")
                         domain_result["metadata"]["graph_db_resource_enum_updated"] = False
                     except Exception as e:
-                        print(f"[!] Resource enum graph update failed: {e}")
+                        logger.info(f"[!] Resource enum graph update failed: {e}")
                         domain_result["metadata"]["graph_db_resource_enum_updated"] = False
                         domain_result["metadata"]["graph_db_resource_enum_error"] = str(e)
 
-                    with open(output_file, 'w') as f:
-                        json.dump(domain_result, f, indent=2)
+                    save_phase_delta(output_file, "graph_db_resource_enum", _delta(domain_result))
 
             # Run vuln_scan if in SCAN_MODULES (when domain_discovery is skipped)
             # vuln_scan automatically includes MITRE CWE/CAPEC enrichment
-            if "vuln_scan" in SCAN_MODULES:
-                domain_result = run_vuln_scan(domain_result, output_file=output_file, settings=_settings)
-                if "metadata" in domain_result and "modules_executed" in domain_result["metadata"]:
-                    if "vuln_scan" not in domain_result["metadata"]["modules_executed"]:
-                        domain_result["metadata"]["modules_executed"].append("vuln_scan")
-                with open(output_file, 'w') as f:
-                    json.dump(domain_result, f, indent=2)
-
-                # Automatically run MITRE CWE/CAPEC enrichment after vuln_scan
-                domain_result = run_mitre_enrichment(domain_result, output_file=output_file, settings=_settings)
-                with open(output_file, 'w') as f:
-                    json.dump(domain_result, f, indent=2)
+            if "vuln_scan" in ENABLED_MODULES:
+                if should_run_phase(domain_result, "vuln_scan"):
+                    from recon.vuln_scan import run_vuln_scan
+                    run_vuln_scan(domain_result, output_file=output_file, settings=_settings)
+                    if "metadata" in domain_result and "modules_executed" in domain_result["metadata"]:
+                        if "vuln_scan" not in domain_result["metadata"]["modules_executed"]:
+                            domain_result["metadata"]["modules_executed"].append("vuln_scan")
+                        # Fresh vuln_scan results have not been enriched yet
+                        if "add_mitre" in domain_result["metadata"]["modules_executed"]:
+                            domain_result["metadata"]["modules_executed"].remove("add_mitre")
+                        domain_result["metadata"].pop("mitre_enrichment", None)
+                    save_phase_delta(output_file, "vuln_scan", _delta(domain_result, "vuln_scan", "technology_cves"))
+
+                # Automatically run MITRE CWE/CAPEC enrichment after vuln_scan. It is
+                # guarded on its own so a failed or interrupted enrichment (DB
+                # download/load) is retried even when vuln_scan itself is skipped
+                if should_run_phase(domain_result, "add_mitre"):
+                    from recon.add_mitre import run_mitre_enrichment
+                    run_mitre_enrichment(domain_result, output_file=output_file, settings=_settings)
+                    if domain_result.get("metadata", {}).get("mitre_enrichment"):
+                        if "add_mitre" not in domain_result["metadata"].get("modules_executed", []):
+                            domain_result["metadata"].setdefault("modules_executed", []).append("add_mitre")
+                    save_phase_delta(output_file, "add_mitre", _delta(domain_result, "vuln_scan", "technology_cves"))
 
                 # Update Graph DB with vuln scan data
                 if UPDATE_GRAPH_DB:
-                    print(f"\n[GRAPH UPDATE] Vuln Scan Data")
-                    print("-" * 40)
+                    logger.info(f"\n[GRAPH UPDATE] Vuln Scan Data")
+                    logger.info(PHASE_RULE)
                     try:
                         from graph_db import Neo4jClient
                         with Neo4jClient() as graph_client:
@@ -791,97 +1038,56 @@ def main():
                                 vuln_stats = graph_client.update_graph_from_vuln_scan(domain_result, USER_ID, PROJECT_ID)
                                 domain_result["metadata"]["graph_db_vuln_scan_updated"] = True
                                 domain_result["metadata"]["graph_db_vuln_scan_stats"] = vuln_stats
-                                print(f"[+] Graph database updated with vuln scan data")
+                                logger.info(f"[+] Graph database updated with vuln scan data")
                             else:
-                                print(f"[!] Could not connect to Neo4j - skipping vuln scan graph update")
+                                logger.info(f"[!] Could not connect to Neo4j - skipping vuln scan graph update")
                                 domain_result["metadata"]["graph_db_vuln_scan_updated"] = False
                     except ImportError:
-                        print(f"[!] Neo4j client not available - skipping vuln scan graph update")
+                        logger.info(f"[!] Neo4j client not available - skipping vuln scan graph update")
                         domain_result["metadata"]["graph_db_vuln_scan_updated"] = False
                     except Exception as e:
-                        print(f"[!] Vuln scan graph update failed: {e}")
+                        logger.info(f"[!] Vuln scan graph update failed: {e}")
                         domain_result["metadata"]["graph_db_vuln_scan_updated"] = False
                         domain_result["metadata"]["graph_db_vuln_scan_error"] = str(e)
 
-                    with open(output_file, 'w') as f:
-                        json.dump(domain_result, f, indent=2)
+                    save_phase_delta(output_file, "graph_db_vuln_scan", _delta(domain_result))
+
+        # Materialize the merged recon JSON once (in-memory data holds all deltas)
+        finalize_recon_file(output_file, domain_result)
 
     # Final summary
-    end_time = datetime.now()
-    duration = (end_time - start_time).total_seconds()
-
-    print("\n")
-    print("─" * 50)
-    print("  RECON PIPELINE COMPLETE")
-    print("─" * 50)
-    print(f"  Duration: {duration:.2f} seconds")
-    print(f"  Target: {root_domain}")
+    duration = time.monotonic() - start_time
+
+    summary = [
+        "\n",
+        SUMMARY_RULE,
+        "  RECON PIPELINE COMPLETE",
+        SUMMARY_RULE,
+        f"  Duration: {duration:.2f} seconds",
+        f"  Target: {root_domain}",
+    ]
     if filtered_mode:
-        print(f"  Mode: Filtered ({len(full_subdomains)} subdomain(s))")
+        summary.append(f"  Mode: Filtered ({len(full_subdomains)} subdomain(s))")
     else:
-        print(f"  Mode: Full discovery")
-        print(f"  Subdomains found: {domain_result.get('subdomain_count', 0)}")
+        summary.append(f"  Mode: Full discovery")
+        summary.append(f"  Subdomains found: {domain_result.get('subdomain_count', 0)}")
 
-    # Port scan stats
-    if "port_scan" in SCAN_MODULES and "port_scan" in domain_result:
-        port_summary = domain_result["port_scan"].get("summary", {})
-        ports = port_summary.get('total_open_ports', 0)
-        hosts = port_summary.get('hosts_with_open_ports', 0)
-        print(f"  Port Scan: {hosts} hosts, {ports} ports")
-    elif "port_scan" not in SCAN_MODULES:
-        print("  Port Scan: SKIPPED")
-
-    # HTTP probe stats
-    if "http_probe" in SCAN_MODULES and "http_probe" in domain_result:
-        http_summary = domain_result["http_probe"].get("summary", {})
-        live = http_summary.get('live_urls', 0)
-        techs = http_summary.get('technology_count', 0)
-        print(f"  HTTP Probe: {live} live URLs, {techs} technologies")
-    elif "http_probe" not in SCAN_MODULES:
-        print("  HTTP Probe: SKIPPED")
-
-    # Check if active scans were skipped due to no live targets
+    # Per-phase stats, or why the phase did not run
     active_scans_skipped = domain_result.get("metadata", {}).get("active_scans_skipped", False)
-    skip_reason = domain_result.get("metadata", {}).get("active_scans_skip_reason", "")
-
-    # Resource enumeration stats
-    if active_scans_skipped:
-        print(f"  Resources: SKIPPED (no live targets)")
-    elif "resource_enum" in SCAN_MODULES and "resource_enum" in domain_result:
-        res_summary = domain_result["resource_enum"].get("summary", {})
-        endpoints = res_summary.get('total_endpoints', 0)
-        params = res_summary.get('total_parameters', 0)
-        forms = res_summary.get('total_forms', 0)
-        print(f"  Resources: {endpoints} endpoints, {params} params, {forms} forms")
-    elif "resource_enum" not in SCAN_MODULES:
-        print("  Resources: SKIPPED")
-
-    # Vuln scan stats (includes MITRE enrichment)
-    if active_scans_skipped:
-        print(f"  Vuln Scan: SKIPPED (no live targets)")
-    elif "vuln_scan" in SCAN_MODULES and "vuln_scan" in domain_result:
-        vuln_summary = domain_result["vuln_scan"].get("summary", {})
-        total_findings = vuln_summary.get("total_findings", 0)
-        crit = vuln_summary.get("critical", 0)
-        high = vuln_summary.get("high", 0)
-        vuln_info = f"{total_findings} findings"
-        if crit > 0 or high > 0:
-            vuln_info += f" ({crit} critical, {high} high)"
-        print(f"  Vuln Scan: {vuln_info}")
+    for label, getter, module, needs_live_targets, report_skip in SUMMARY_ROWS:
+        if needs_live_targets and active_scans_skipped:
+            status = "SKIPPED (no live targets)" if report_skip else None
+        elif module not in ENABLED_MODULES:
+            status = "SKIPPED" if report_skip else None
+        elif module in domain_result:
+            status = getter(domain_result)
+        else:
+            status = None
+        if status is not None:
+            summary.append(f"  {label}: {status}")
 
-        # MITRE enrichment stats (part of vuln_scan)
-        mitre_meta = domain_result.get("metadata", {}).get("mitre_enrichment", {})
-        if mitre_meta:
-            enriched = mitre_meta.get('total_cves_enriched', 0)
-            total = mitre_meta.get('total_cves_processed', 0)
-            print(f"  MITRE CWE/CAPEC: {enriched}/{total} CVEs enriched")
-    elif "vuln_scan" not in SCAN_MODULES:
-        print("  Vuln Scan: SKIPPED")
-
-    print("─" * 50)
-    print("  Output: recon_{}.json".format(PROJECT_ID))
-    print("─" * 50)
-    print()
+    summary += [SUMMARY_RULE, "  Output: recon_{}.json".format(PROJECT_ID), SUMMARY_RULE, ""]
+    logger.info("\n".join(summary))
 
     return 0
 
@@ -35,6 +35,8 @@ DEFAULT_SETTINGS: dict[str, Any] = {
     'UPDATE_GRAPH_DB': True,
     'USE_TOR_FOR_RECON': False,
     'USE_BRUTEFORCE_FOR_SUBDOMAINS': True,
+    # Resume: skip phases already in modules_executed (local runs only, off by default)
+    'SKIP_COMPLETED_PHASES': False,
 
     # WHOIS/DNS
     'WHOIS_MAX_RETRIES': 6,
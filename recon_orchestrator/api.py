@@ -308,19 +308,22 @@ async def delete_recon_data(project_id: str):
     # Inside the orchestrator container, the output is at /app/recon/output
     output_dir = Path("/app/recon/output")
     recon_file = output_dir / f"recon_{project_id}.json"
+    # NDJSON phase-delta sidecar left behind by an interrupted recon run
+    delta_file = output_dir / f"recon_{project_id}.ndjson"
 
     deleted_files = []
     errors = []
 
-    # Delete recon JSON file
-    if recon_file.exists():
-        try:
-            os.remove(recon_file)
-            deleted_files.append(str(recon_file))
-            logger.info(f"Deleted recon file: {recon_file}")
-        except Exception as e:
-            errors.append(f"Failed to delete {recon_file}: {e}")
-            logger.error(f"Failed to delete recon file: {e}")
+    # Delete recon JSON file and its delta sidecar
+    for file_path in (recon_file, delta_file):
+        if file_path.exists():
+            try:
+                os.remove(file_path)
+                deleted_files.append(str(file_path))
+                logger.info(f"Deleted recon file: {file_path}")
+            except Exception as e:
+                errors.append(f"Failed to delete {file_path}: {e}")
+                logger.error(f"Failed to delete recon file: {e}")
 
     # Also clean up any running state for this project
     if container_manager and project_id in container_manager.running_states:
@@ -346,6 +349,7 @@ async def delete_project_files(project_id: str):
 
     files_to_delete = [
         Path("/app/recon/output") / f"recon_{project_id}.json",
+        Path("/app/recon/output") / f"recon_{project_id}.ndjson",
         Path("/app/gvm_scan/output") / f"gvm_{project_id}.json",
         Path("/app/github_secret_hunt/output") / f"github_hunt_{project_id}.json",
     ]
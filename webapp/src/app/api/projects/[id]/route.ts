@@ -112,6 +112,7 @@ export async function DELETE(_request: NextRequest, { params }: RouteParams) {
       // Fallback: try to delete locally (may fail in Docker due to read-only mounts)
       const filesToDelete = [
         { path: path.join(RECON_OUTPUT_PATH, `recon_${id}.json`), name: 'recon' },
+        { path: path.join(RECON_OUTPUT_PATH, `recon_${id}.ndjson`), name: 'recon delta' },
         { path: path.join(GVM_OUTPUT_PATH, `gvm_${id}.json`), name: 'GVM' },
         { path: path.join(GITHUB_HUNT_OUTPUT_PATH, `github_hunt_${id}.json`), name: 'GitHub hunt' },
       ]